@@ -10,15 +10,32 @@ technologies sections.
 
 import os
 import sys
+import csv
 import json
+import asyncio
+import re
+import ssl
+import hashlib
+import time
+import random
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+import certifi
 import click
+import httpx
 import yaml
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, OpenAI
+
+# Use the C-backed YAML loader when PyYAML was built with libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 # Optional desktop notification support
 # Install plyer with: pip install plyer
@@ -30,26 +47,296 @@ except ImportError:
 # Load environment variables from .env file
 load_dotenv()
 
+# Shared HTTP connection pool so every OpenAI client reuses TCP/TLS connections
+# (and a single SSL context) instead of setting up its own. The context trusts
+# certifi's CA bundle, like httpx does by default, rather than the OS store.
+_SHARED_SSL = ssl.create_default_context(cafile=certifi.where())
+_HTTPX_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_SHARED_HTTPX = httpx.Client(verify=_SHARED_SSL, limits=_HTTPX_LIMITS)
+
+# Model used for every customization
+MODEL = "openai/gpt-5-mini"
+
+# Bump whenever the prompt text changes, so cached responses to older prompts are not reused
+PROMPT_VERSION = 3
+
+# Prompt text is ordered from invariant to variable (system message, instructions,
+# resume, job posting) so OpenRouter's prompt caching can reuse the longest
+# possible prefix when one resume is customized for many postings.
+_SYSTEM_MSG = "You are an expert resume writer and ATS optimization specialist. You will receive a resume in YAML format and a job posting. Your task is to modify ONLY the highlights in the Experience section and the Technologies section to better match the job posting while keeping all other content exactly the same."
+
+# Request parts that never change are built once rather than on every API call
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_MSG}
+_EXTRA_HEADERS = {
+    "HTTP-Referer": "https://github.com/dillhicks/resuminer-cli",
+    "X-Title": "Resume Customizer CLI",
+}
+
+# Customization instructions shared by the single and marshalled prompts
+_PROMPT_INSTRUCTIONS = """INSTRUCTIONS:
+Please modify the resume below to better match the job posting below. You must:
+
+1. EXPERIENCE SECTION HIGHLIGHTS:
+   - Reorder the highlights (bullet points) within each job in the Experience section
+   - Put the most relevant highlights first based on the job posting requirements
+   - Keep all highlights but reorder them by relevance to the job posting
+   - Do not add, remove, or modify the content of highlights - only reorder them
+
+2. TECHNOLOGIES SECTION:
+   - Remove technologies that are not relevant at all to the job posting
+   - Keep technologies that are mentioned or very closely related to those in the job posting
+   - Reorder the technologies to put the most relevant ones first, and reorder each technology category if needed.
+   - Add important technologies from the job posting that are missing but would be relevant. 
+   - Only add important technologies that are equivalents or very closely related to those already listed in the resume.
+   - Only modify the "details" field within each technology category
+   - Maintain the same technology categories/labels
+
+3. IMPORTANT RESTRICTIONS:
+   - ONLY modify the highlights in the Experience section and details in the Technologies section
+   - Keep all other sections, formatting, and content exactly the same
+   - Return the complete modified YAML with proper formatting
+   - Do not change section names, structure, or any other content"""
+
+# Opening markdown code fence of a YAML response; only the start is matched, so the body is never scanned
+_OPENING_FENCE_RE = re.compile(r"\A\s*```(?:ya?ml)?[ \t]*\n?")
+
+# Invariant start of each prompt, built once; only the resume and job posting are appended per call
+_PROMPT_HEAD = f"""
+{_PROMPT_INSTRUCTIONS}
+
+CRITICAL: Return ONLY the raw YAML content. Do not wrap it in code blocks, markdown, or any other formatting. Return the YAML exactly as it should be parsed. Be direct and focused in your modifications.
+
+CURRENT RESUME (YAML format):
+"""
+
+_MARSHALLED_PROMPT_HEAD = f"""
+{_PROMPT_INSTRUCTIONS}
+
+You will receive several numbered pairs of a resume and a job posting. Customize each resume for the job posting in the same pair, independently of the other pairs.
+
+CRITICAL: Return ONLY the modified resumes as raw YAML documents, one per pair in the same order as the pairs, separated by a line containing only `---`. Do not wrap them in code blocks, markdown, or any other formatting, and do not add pair headings. Be direct and focused in your modifications.
+
+"""
+
+# Separator between YAML documents in a marshalled response
+_DOCUMENT_SEPARATOR_RE = re.compile(r"^---[ \t]*$", re.MULTILINE)
+
+# Job postings shorter than this are almost certainly the wrong file
+MIN_JOB_POSTING_LENGTH = 50
+
+# Location of the on-disk cache of AI responses
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "resuminer"
+
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed API request may succeed if sent again."""
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code in _RETRYABLE_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retrying, with exponential backoff and jitter."""
+    return min(60, 2 ** attempt + random.random())
+
+
+class ResponseCache:
+    """Persistent on-disk cache of customized resume YAML.
+
+    Entries are stored as ``<key>.yml`` files in the cache directory, with an
+    ``index.json`` file tracking how often each entry has been used. When the
+    cache grows past ``max_entries``, the least frequently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_entries: int = 100):
+        """Initialize the cache in the given directory."""
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.index_file = self.cache_dir / "index.json"
+
+    @staticmethod
+    def make_key(resume_content: str, job_posting: str) -> str:
+        """Build the cache key for a (resume, job posting) pair under the current model and prompt."""
+        prefix = f"{MODEL}\0{PROMPT_VERSION}\0".encode()
+        return hashlib.sha256(prefix + resume_content.encode() + b"\0" + job_posting.encode()).hexdigest()
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        """Write a file via a temporary file and rename, so readers never see a partial write."""
+        with tempfile.NamedTemporaryFile(mode='w', dir=self.cache_dir, suffix='.tmp', delete=False,
+                                         encoding='utf-8') as f:
+            f.write(content)
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+
+    def _load_index(self) -> dict:
+        """Load the usage counters, returning an empty index if none exists or it is damaged."""
+        try:
+            index = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(index, dict) or not all(type(count) is int for count in index.values()):
+            return {}
+        return index
+
+    def _save_index(self, index: dict) -> None:
+        """Write the usage counters back to disk."""
+        self._write_atomic(self.index_file, json.dumps(index))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached YAML for a key, or None on a miss."""
+        try:
+            content = (self.cache_dir / f"{key}.yml").read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        # Cache bookkeeping should never break a run
+        try:
+            index = self._load_index()
+            index[key] = index.get(key, 0) + 1
+            self._save_index(index)
+        except (OSError, TypeError, ValueError):
+            pass
+
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store YAML for a key, evicting the least frequently used entries if needed."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.cache_dir / f"{key}.yml", content)
+
+            index = self._load_index()
+            index[key] = index.get(key, 0) + 1
+
+            # Entries missing from the index (e.g. after it was lost) are evictable as unused
+            for entry in self.cache_dir.glob("*.yml"):
+                index.setdefault(entry.stem, 0)
+
+            # Evict least frequently used entries, never the one just stored
+            while len(index) > self.max_entries:
+                victim = min((k for k in index if k != key), key=index.get)
+                del index[victim]
+                (self.cache_dir / f"{victim}.yml").unlink(missing_ok=True)
+
+            self._save_index(index)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests per minute and tokens per minute.
+
+    Capacity for each limit refills continuously at ``limit / 60`` per second, up
+    to one minute's worth (and at least one request). A limit of None disables
+    that bucket.
+    """
+
+    def __init__(self, max_rpm: Optional[float] = None, max_tpm: Optional[float] = None):
+        """Initialize with full buckets for the given limits."""
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        # Below 1 RPM a minute's worth is less than one request, which could never be sent
+        self.request_capacity_limit = max(max_rpm, 1) if max_rpm else 0.0
+        self.available_request_capacity = self.request_capacity_limit
+        self.available_token_capacity = max_tpm or 0.0
+        self._last_update = time.monotonic()
+
+    def _replenish(self) -> None:
+        """Add the capacity accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+
+        if self.max_rpm:
+            self.available_request_capacity = min(
+                self.request_capacity_limit, self.available_request_capacity + self.max_rpm * elapsed / 60
+            )
+        if self.max_tpm:
+            self.available_token_capacity = min(
+                self.max_tpm, self.available_token_capacity + self.max_tpm * elapsed / 60
+            )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request using roughly ``tokens`` tokens may be sent."""
+        # A request larger than the whole bucket only has to wait for a full bucket
+        tokens = min(tokens, self.max_tpm) if self.max_tpm else 0
+
+        while True:
+            self._replenish()
+
+            wait = 0.0
+            if self.max_rpm and self.available_request_capacity < 1:
+                wait = max(wait, (1 - self.available_request_capacity) * 60 / self.max_rpm)
+            if self.max_tpm and self.available_token_capacity < tokens:
+                wait = max(wait, (tokens - self.available_token_capacity) * 60 / self.max_tpm)
+
+            if not wait:
+                if self.max_rpm:
+                    self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return
+
+            await asyncio.sleep(wait)
+
 
 class ResumeCustomizer:
     """Main class for customizing resumes based on job postings."""
 
-    def __init__(self, api_key: str):
-        """Initialize with OpenRouter API key."""
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None, max_attempts: int = 5, verbose: bool = False,
+                 keep_yaml: bool = False, use_cached: bool = True):
+        """Initialize with OpenRouter API key, an optional response cache and batch rate limits.
+
+        The API key defaults to the OPENROUTER_API_KEY environment variable. With
+        use_cached off, cached responses are ignored but new responses still replace them.
+        """
+        if api_key is None:
+            api_key = os.getenv('OPENROUTER_API_KEY')
+        if not api_key:
+            raise click.ClickException(
+                "OpenRouter API key not found. Please set OPENROUTER_API_KEY in your .env file.\n"
+                "Example .env file:\nOPENROUTER_API_KEY=sk-or-v1-your-key-here"
+            )
+
         self.api_key = api_key
+        self.cache = cache
+        self.use_cached = use_cached
+        self.rate_limiter = rate_limiter
+        self.max_attempts = max_attempts
+        self.verbose = verbose
+        self.keep_yaml = keep_yaml
+
+        # Created once and reused for every request made by this customizer
         self.client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key,
+            http_client=_SHARED_HTTPX,
+            # Retries are handled here, so every HTTP request counts against max_attempts
+            # and, in batch mode, goes through the rate limiter
+            max_retries=0,
         )
+        # Async connections belong to an event loop, so this is created per batch run
+        self.async_client = None
 
     def read_file(self, file_path: str) -> str:
         """Read file content as string."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
+            return Path(file_path).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
             raise click.ClickException(f"Error reading {file_path}: {str(e)}")
 
+    async def read_file_async(self, file_path: str) -> str:
+        """Read file content as string in a worker thread."""
+        return await asyncio.to_thread(self.read_file, file_path)
+
     def call_openrouter(self, resume_content: str, job_posting: str) -> str:
         """Call OpenRouter API with GPT-5 to customize resume."""
         prompt = self._create_prompt(resume_content, job_posting)
@@ -62,99 +349,151 @@ class ResumeCustomizer:
 
         return cleaned_content
 
+    async def call_openrouter_async(self, resume_content: str, job_posting: str) -> str:
+        """Async variant of call_openrouter for batch mode."""
+        prompt = self._create_prompt(resume_content, job_posting)
+        response_content = await self._make_api_call_async(prompt)
+        return self._clean_yaml_response(response_content)
+
+    async def call_openrouter_marshalled_async(self, pairs: list) -> list:
+        """Customize several (resume, job posting) pairs with a single API request.
+
+        Returns the YAML documents from the response, which should contain one per pair.
+        """
+        prompt = self._create_marshalled_prompt(pairs)
+        response_content = await self._make_api_call_async(prompt)
+        cleaned_content = self._clean_yaml_response(response_content)
+
+        # The model may also fence each document separately
+        documents = (
+            self._clean_yaml_response(document)
+            for document in _DOCUMENT_SEPARATOR_RE.split(cleaned_content)
+        )
+        return [document for document in documents if document]
+
+    def _api_request_kwargs(self, prompt: str) -> dict:
+        """Build the chat completion request shared by the sync and async clients."""
+        return dict(
+            extra_headers=_EXTRA_HEADERS,
+            model=MODEL,
+
+            messages=[
+                _SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.2,  # Medium reasoning effort - between focused (0.1) and creative (0.3)
+        )
+
     def _make_api_call(self, prompt: str) -> str:
-        """Make the actual API call to OpenRouter using OpenAI client."""
-        try:
-            # Create the full prompt with system message included
-            full_prompt = "You are an expert resume writer and ATS optimization specialist. You will receive a resume in YAML format and a job posting. Your task is to modify ONLY the highlights in the Experience section and the Technologies section to better match the job posting while keeping all other content exactly the same.\n\n" + prompt
-
-            completion = self.client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://github.com/dillhicks/resuminer-cli",
-                    "X-Title": "Resume Customizer CLI",
-                },
-                model="openai/gpt-5-mini",  
-
-                messages=[
-                    {
-                        "role": "user",
-                        "content": full_prompt
-                    }
-                ],
-                temperature=0.2,  # Medium reasoning effort - between focused (0.1) and creative (0.3)
-            )
+        """Make the actual API call to OpenRouter using OpenAI client.
 
-            return completion.choices[0].message.content.strip()
+        The response is streamed, and echoed as it arrives in verbose mode. Rate
+        limits and transient server or connection errors are retried with backoff.
+        """
+        request = self._api_request_kwargs(prompt)
+
+        try:
+            for attempt in range(self.max_attempts):
+                try:
+                    return self._stream_completion(request)
+                except (APIConnectionError, APIStatusError) as e:
+                    if not _is_retryable(e) or attempt == self.max_attempts - 1:
+                        raise
+                    delay = _backoff_delay(attempt)
+                    click.echo(f"API request failed ({e}), retrying in {delay:.1f}s...", err=True)
+                    time.sleep(delay)
 
         except Exception as e:
             raise click.ClickException(f"API request failed: {str(e)}")
 
-    def _clean_yaml_response(self, response_content: str) -> str:
-        """Clean YAML response by removing markdown formatting."""
-        # Remove markdown code block markers
-        cleaned = response_content.strip()
+    def _stream_completion(self, request: dict) -> str:
+        """Stream a single completion and return its content."""
+        completion = self.client.chat.completions.create(**request, stream=True)
 
-        # Remove ```yaml or ```yml markers
-        if cleaned.startswith('```yaml'):
-            cleaned = cleaned[7:].strip()
-        elif cleaned.startswith('```yml'):
-            cleaned = cleaned[7:].strip()
-        elif cleaned.startswith('```'):
-            cleaned = cleaned[3:].strip()
+        buf = []
+        try:
+            for chunk in completion:
+                # Keep-alive and usage chunks carry no choices
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content or ""
+                buf.append(content)
+                if self.verbose:
+                    click.echo(content, nl=False)
+        finally:
+            # End the echoed line, so a retry message after a partial response starts on its own line
+            if self.verbose and any(buf):
+                click.echo()
 
-        # Remove ending ``` if present
-        if cleaned.endswith('```'):
-            cleaned = cleaned[:-3].strip()
+        return "".join(buf).strip()
 
-        return cleaned
+    async def _make_api_call_async(self, prompt: str) -> str:
+        """Make the API call to OpenRouter using the async OpenAI client.
 
-    def _create_prompt(self, resume_content: str, job_posting: str) -> str:
-        """Create the comprehensive prompt for GPT-5."""
-        return f"""
-JOB POSTING:
-{job_posting}
-
-CURRENT RESUME (YAML format):
-{resume_content}
+        Waits on the rate limiter before each attempt. Rate limits and transient
+        server or connection errors are retried with backoff.
+        """
+        request = self._api_request_kwargs(prompt)
+        # Rough token estimate of ~4 characters per token
+        tokens = sum(len(message["content"]) for message in request["messages"]) // 4
 
-INSTRUCTIONS:
-Please modify the resume to better match this job posting. You must:
+        try:
+            for attempt in range(self.max_attempts):
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(tokens)
+                try:
+                    completion = await self.async_client.chat.completions.create(**request)
+                    break
+                except (APIConnectionError, APIStatusError) as e:
+                    if not _is_retryable(e) or attempt == self.max_attempts - 1:
+                        raise
+                    delay = _backoff_delay(attempt)
+                    click.echo(f"API request failed ({e}), retrying in {delay:.1f}s...", err=True)
+                    await asyncio.sleep(delay)
 
-1. EXPERIENCE SECTION HIGHLIGHTS:
-   - Reorder the highlights (bullet points) within each job in the Experience section
-   - Put the most relevant highlights first based on the job posting requirements
-   - Keep all highlights but reorder them by relevance to the job posting
-   - Do not add, remove, or modify the content of highlights - only reorder them
+            return completion.choices[0].message.content.strip()
 
-2. TECHNOLOGIES SECTION:
-   - Remove technologies that are not relevant at all to the job posting
-   - Keep technologies that are mentioned or very closely related to those in the job posting
-   - Reorder the technologies to put the most relevant ones first, and reorder each technology category if needed.
-   - Add important technologies from the job posting that are missing but would be relevant. 
-   - Only add important technologies that are equivalents or very closely related to those already listed in the resume.
-   - Only modify the "details" field within each technology category
-   - Maintain the same technology categories/labels
+        except Exception as e:
+            raise click.ClickException(f"API request failed: {str(e)}")
 
-3. IMPORTANT RESTRICTIONS:
-   - ONLY modify the highlights in the Experience section and details in the Technologies section
-   - Keep all other sections, formatting, and content exactly the same
-   - Return the complete modified YAML with proper formatting
-   - Do not change section names, structure, or any other content
+    def _clean_yaml_response(self, response_content: str) -> str:
+        """Clean YAML response by removing markdown formatting."""
+        # Remove the opening ```yaml, ```yml or ``` marker if present
+        match = _OPENING_FENCE_RE.match(response_content)
+        cleaned = response_content[match.end():] if match else response_content
 
-CRITICAL: Return ONLY the raw YAML content. Do not wrap it in code blocks, markdown, or any other formatting. Return the YAML exactly as it should be parsed. Be direct and focused in your modifications.
-"""
+        # Remove ending ``` if present
+        return cleaned.strip().removesuffix('```').strip()
 
-    def save_temp_resume(self, modified_yaml: str) -> str:
-        """Save modified YAML to temporary file."""
+    def _create_prompt(self, resume_content: str, job_posting: str) -> str:
+        """Create the comprehensive prompt for GPT-5."""
+        return "".join((_PROMPT_HEAD, resume_content, "\n\nJOB POSTING:\n", job_posting, "\n"))
+
+    def _create_marshalled_prompt(self, pairs: list) -> str:
+        """Create one prompt covering several (resume, job posting) pairs."""
+        sections = [
+            f"### PAIR {number}\nCURRENT RESUME (YAML format):\n{resume_content}\n\nJOB POSTING:\n{job_posting}\n"
+            for number, (resume_content, job_posting) in enumerate(pairs, start=1)
+        ]
+        return _MARSHALLED_PROMPT_HEAD + "\n".join(sections)
+
+    def pipe_and_render(self, modified_yaml: str, output_name: str = "tempresume") -> None:
+        """Render modified YAML using renderCV.
+
+        renderCV only reads resumes from a file, so the YAML goes through a temporary
+        file that is removed afterwards unless keep_yaml is set.
+        """
+        # Closed before rendering so renderCV can open it on every platform
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False, encoding='utf-8') as f:
             f.write(modified_yaml)
-            return f.name
+            temp_file = f.name
 
-    def render_resume(self, temp_file: str, output_name: str = "tempresume") -> None:
-        """Render resume using renderCV."""
         try:
             # Use rendercv render command
-            cmd = ["rendercv", "render", temp_file]
+            cmd = ["rendercv", "render", temp_file, "--pdf-path", f"{output_name}.pdf"]
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
             click.echo(f"Resume rendered successfully as '{output_name}.pdf'")
@@ -166,50 +505,301 @@ CRITICAL: Return ONLY the raw YAML content. Do not wrap it in code blocks, markd
         except FileNotFoundError:
             raise click.ClickException("rendercv command not found. Please ensure renderCV is installed.")
         finally:
-            # Keep temporary file for inspection (user requested)
-            click.echo(f"Temporary YAML file saved as: {temp_file}")
-            click.echo("You can inspect the modified resume YAML file before deleting it.")
+            if self.keep_yaml:
+                # Keep temporary file for inspection
+                click.echo(f"Temporary YAML file saved as: {temp_file}")
+                click.echo("You can inspect the modified resume YAML file before deleting it.")
+            else:
+                Path(temp_file).unlink(missing_ok=True)
 
     def customize_resume(self, resume_file: str, job_posting_file: str, output_name: str = "tempresume") -> None:
             """Main method to customize resume."""
-            # Check for API key in environment
-            api_key = os.getenv('OPENROUTER_API_KEY')
-            if not api_key:
-                raise click.ClickException(
-                    "OpenRouter API key not found. Please set OPENROUTER_API_KEY in your .env file.\n"
-                    "Example .env file:\nOPENROUTER_API_KEY=sk-or-v1-your-key-here"
-                )
-
-            # Update the API key and reinitialize the OpenAI client
-            self.api_key = api_key
-            self.client = OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=api_key,
-            )
-    
             # Read input files
             resume_content = self.read_file(resume_file)
             job_posting = self.read_file(job_posting_file)
     
-            # Validate YAML format
-            try:
-                yaml.safe_load(resume_content)
-            except yaml.YAMLError as e:
-                raise click.ClickException(f"Invalid YAML format in resume file: {str(e)}")
+            # Validate inputs before spending an API request on them
+            self._validate_resume_yaml(resume_content)
+            self._validate_job_posting(job_posting, job_posting_file)
     
-            # Call OpenRouter API
-            click.echo("Customizing resume with AI...")
-            modified_yaml = self.call_openrouter(resume_content, job_posting)
+            # Reuse a previous response for the same inputs if available
+            cache_key = ResponseCache.make_key(resume_content, job_posting)
+            modified_yaml = self._get_cached(cache_key)
+
+            if modified_yaml is not None:
+                click.echo("Using cached customization (pass --no-cache to regenerate)...")
+            else:
+                # Call OpenRouter API
+                click.echo("Customizing resume with AI...")
+                modified_yaml = self.call_openrouter(resume_content, job_posting)
+
+                # Validate modified YAML
+                self._validate_modified_yaml(modified_yaml)
+
+                if self.cache is not None:
+                    self.cache.put(cache_key, modified_yaml)
     
-            # Validate modified YAML
+            # Render via a short-lived temporary file
+            self.pipe_and_render(modified_yaml, output_name)
+
+    def customize_many(self, jobs: list, max_concurrent: int = 10, marshal_batch: int = 1) -> list:
+        """Customize resumes for many (resume, job posting, output) jobs concurrently.
+
+        With ``marshal_batch`` above 1, up to that many jobs share a single API request.
+        Returns one entry per job: None on success, or the exception that job raised.
+        """
+        return asyncio.run(self._customize_many_async(jobs, max_concurrent, marshal_batch))
+
+    async def _customize_many_async(self, jobs: list, max_concurrent: int, marshal_batch: int) -> list:
+        """Fan out all jobs, limiting the number of in-flight API requests."""
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Pooled connections are tied to this event loop, so the client is closed with it
+        async with httpx.AsyncClient(verify=_SHARED_SSL, limits=_HTTPX_LIMITS) as http_client:
+            self.async_client = AsyncOpenAI(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=self.api_key,
+                http_client=http_client,
+                max_retries=0,
+            )
             try:
-                yaml.safe_load(modified_yaml)
-            except yaml.YAMLError as e:
-                raise click.ClickException(f"AI returned invalid YAML: {str(e)}")
-    
-            # Save and render
-            temp_file = self.save_temp_resume(modified_yaml)
-            self.render_resume(temp_file, output_name)
+                # renderCV writes intermediate files to a shared folder, so render one at a time
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as render_executor:
+                    return await self._dispatch_jobs(jobs, marshal_batch, semaphore, render_executor)
+            finally:
+                self.async_client = None
+
+    async def _dispatch_jobs(self, jobs: list, marshal_batch: int, semaphore: asyncio.Semaphore,
+                             render_executor: ThreadPoolExecutor) -> list:
+        """Start a task per job, or per chunk of jobs when marshalling, and collect the results."""
+        if marshal_batch <= 1:
+            tasks = [
+                asyncio.create_task(self._customize_one_async(resume_file, job_posting_file, output_name, semaphore, render_executor))
+                for resume_file, job_posting_file, output_name in jobs
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        tasks = [
+            asyncio.create_task(self._customize_chunk_async(jobs[start:start + marshal_batch], semaphore, render_executor))
+            for start in range(0, len(jobs), marshal_batch)
+        ]
+        chunk_results = await asyncio.gather(*tasks)
+        return [result for results in chunk_results for result in results]
+
+    async def _customize_one_async(self, resume_file: str, job_posting_file: str, output_name: str,
+                                   semaphore: asyncio.Semaphore, render_executor: ThreadPoolExecutor) -> None:
+        """Customize a single resume as part of a batch."""
+        resume_content, job_posting, cache_key, modified_yaml = await self._load_job_async(resume_file, job_posting_file)
+
+        if modified_yaml is not None:
+            click.echo(f"[{output_name}] Using cached customization...")
+        else:
+            async with semaphore:
+                click.echo(f"[{output_name}] Customizing resume with AI...")
+                modified_yaml = await self.call_openrouter_async(resume_content, job_posting)
+
+            self._store_result(cache_key, modified_yaml)
+
+        await self._render_async(modified_yaml, output_name, render_executor)
+
+    async def _customize_chunk_async(self, chunk: list, semaphore: asyncio.Semaphore,
+                                     render_executor: ThreadPoolExecutor) -> list:
+        """Customize several resumes as part of a batch with one marshalled API request.
+
+        Jobs with a cached result are left out of the request. If the response does not
+        hold one YAML document per job, the jobs fall back to individual requests.
+        """
+        results = [None] * len(chunk)
+        pending = []
+        finished = []
+
+        loaded = await asyncio.gather(
+            *(self._load_job_async(resume_file, job_posting_file) for resume_file, job_posting_file, _ in chunk),
+            return_exceptions=True,
+        )
+
+        for index, ((_, _, output_name), job) in enumerate(zip(chunk, loaded)):
+            if isinstance(job, Exception):
+                results[index] = job
+                continue
+
+            resume_content, job_posting, cache_key, cached_yaml = job
+
+            if cached_yaml is not None:
+                click.echo(f"[{output_name}] Using cached customization...")
+                finished.append((index, cached_yaml))
+            else:
+                pending.append((index, resume_content, job_posting, cache_key))
+
+        if pending:
+            names = ", ".join(chunk[index][2] for index, _, _, _ in pending)
+            try:
+                async with semaphore:
+                    click.echo(f"[{names}] Customizing resumes with AI in one request...")
+                    documents = await self.call_openrouter_marshalled_async(
+                        [(resume_content, job_posting) for _, resume_content, job_posting, _ in pending]
+                    )
+            except Exception as e:
+                for index, _, _, _ in pending:
+                    results[index] = e
+                documents = None
+
+            if documents is not None and len(documents) != len(pending):
+                click.echo(f"[{names}] AI returned {len(documents)} resumes for {len(pending)} jobs, "
+                           "retrying individually...")
+                retries = await asyncio.gather(
+                    *(self._customize_one_async(*chunk[index], semaphore, render_executor) for index, _, _, _ in pending),
+                    return_exceptions=True,
+                )
+                for (index, _, _, _), result in zip(pending, retries):
+                    results[index] = result
+            elif documents is not None:
+                for (index, _, _, cache_key), modified_yaml in zip(pending, documents):
+                    try:
+                        self._store_result(cache_key, modified_yaml)
+                        finished.append((index, modified_yaml))
+                    except Exception as e:
+                        results[index] = e
+
+        for index, modified_yaml in sorted(finished):
+            try:
+                await self._render_async(modified_yaml, chunk[index][2], render_executor)
+            except Exception as e:
+                results[index] = e
+
+        return results
+
+    async def _load_job_async(self, resume_file: str, job_posting_file: str) -> tuple:
+        """Read and validate a job's inputs.
+
+        Returns the resume, job posting, cache key and cached YAML (None on a miss).
+        """
+        # Both files are read concurrently, overlapping with other jobs' API requests
+        resume_content, job_posting = await asyncio.gather(
+            self.read_file_async(resume_file),
+            self.read_file_async(job_posting_file),
+        )
+
+        self._validate_resume_yaml(resume_content)
+        self._validate_job_posting(job_posting, job_posting_file)
+
+        cache_key = ResponseCache.make_key(resume_content, job_posting)
+        cached_yaml = self._get_cached(cache_key)
+        return resume_content, job_posting, cache_key, cached_yaml
+
+    def _get_cached(self, cache_key: str) -> Optional[str]:
+        """Return a valid cached response for a key, or None to call the AI."""
+        if self.cache is None or not self.use_cached:
+            return None
+
+        cached_yaml = self.cache.get(cache_key)
+        if cached_yaml is None:
+            return None
+
+        # A damaged entry counts as a miss and is overwritten by the fresh response
+        try:
+            self._validate_modified_yaml(cached_yaml)
+        except click.ClickException:
+            return None
+        return cached_yaml
+
+    def _store_result(self, cache_key: str, modified_yaml: str) -> None:
+        """Validate an AI response and add it to the cache."""
+        self._validate_modified_yaml(modified_yaml)
+
+        if self.cache is not None:
+            self.cache.put(cache_key, modified_yaml)
+
+    async def _render_async(self, modified_yaml: str, output_name: str, render_executor: ThreadPoolExecutor) -> None:
+        """Render a resume without blocking the event loop."""
+        # Render on the render thread so other jobs keep making API requests meanwhile
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(render_executor, self.pipe_and_render, modified_yaml, output_name)
+
+    def _validate_resume_yaml(self, resume_content: str) -> None:
+        """Make sure the input resume is valid renderCV YAML."""
+        try:
+            data = yaml.load(resume_content, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise click.ClickException(f"Invalid YAML format in resume file: {str(e)}")
+
+        if not isinstance(data, dict) or "cv" not in data:
+            raise click.ClickException("Resume file is not a renderCV resume: missing top-level 'cv' section.")
+
+    def _validate_job_posting(self, job_posting: str, job_posting_file: str) -> None:
+        """Make sure the job posting has enough text to customize against."""
+        length = len(job_posting.strip())
+        if length < MIN_JOB_POSTING_LENGTH:
+            raise click.ClickException(
+                f"Job posting {job_posting_file} is too short ({length} characters). "
+                "Please check that it contains the full job description."
+            )
+
+    def _validate_modified_yaml(self, modified_yaml: str) -> None:
+        """Make sure the AI response is valid YAML."""
+        try:
+            yaml.load(modified_yaml, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise click.ClickException(f"AI returned invalid YAML: {str(e)}")
+
+
+def load_batch_jobs(postings: str, resume_file: Optional[str] = None) -> list:
+    """Build the list of (resume, job posting, output) jobs for batch mode.
+
+    ``postings`` is either a directory of job posting .txt files, each paired with
+    ``resume_file``, or a CSV manifest with ``resume_file``, ``job_posting_file`` and
+    optional ``output`` columns. Relative paths in a manifest are resolved against
+    the manifest's directory. Every job must have a distinct output name, since
+    jobs sharing one would overwrite each other's PDF.
+    """
+    postings_path = Path(postings)
+
+    if postings_path.is_dir():
+        if not resume_file:
+            raise click.ClickException("--resume is required when POSTINGS is a directory.")
+        return [
+            (resume_file, str(posting), posting.stem)
+            for posting in sorted(postings_path.glob('*.txt'))
+        ]
+
+    jobs = []
+    postings_by_output = {}
+    base_dir = postings_path.parent
+    with open(postings_path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            posting = row.get('job_posting_file')
+            if not posting:
+                raise click.ClickException(f"Manifest {postings} is missing a job_posting_file entry.")
+
+            resume = str(base_dir / row['resume_file']) if row.get('resume_file') else resume_file
+            if not resume:
+                raise click.ClickException(f"No resume_file given for {posting} in {postings}.")
+
+            output = row.get('output') or Path(posting).stem
+            if output in postings_by_output:
+                raise click.ClickException(
+                    f"Job postings {postings_by_output[output]} and {posting} in {postings} would both be "
+                    f"saved as '{output}.pdf'. Please give them different output names."
+                )
+            postings_by_output[output] = posting
+
+            jobs.append((resume, str(base_dir / posting), output))
+    return jobs
+
+
+def send_notification(title: str, message: str) -> None:
+    """Send a desktop notification if plyer is available."""
+    if notification:
+        try:
+            notification.notify(
+                title=title,
+                message=message,
+                app_name="Resume Customizer",
+                timeout=5
+            )
+        except Exception:
+            # Silently fail if notification fails - don't interrupt the main flow
+            pass
 
 
 @click.group()
@@ -223,10 +813,20 @@ def cli():
 @click.argument('job_posting_file', type=click.Path(exists=True))
 @click.option('--output', '-o', default='tempresume', help='Output filename (without extension)')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def customize(resume_file, job_posting_file, output, verbose):
+@click.option('--no-cache', is_flag=True, help='Ignore cached results and always call the AI (the new result is still cached)')
+@click.option('--keep-yaml', is_flag=True, help='Keep the modified resume YAML file for inspection')
+@click.option('--max-attempts', default=5, show_default=True, type=click.IntRange(min=1),
+              help='Attempts per request on rate limits and transient errors')
+def customize(resume_file, job_posting_file, output, verbose, no_cache, keep_yaml, max_attempts):
     """Customize a resume based on a job posting."""
     try:
-        customizer = ResumeCustomizer("")  # API key will be loaded from environment
+        customizer = ResumeCustomizer(  # API key is loaded from environment
+            cache=ResponseCache(),
+            use_cached=not no_cache,
+            max_attempts=max_attempts,
+            verbose=verbose,
+            keep_yaml=keep_yaml,
+        )
 
         if verbose:
             click.echo(f"Processing resume: {resume_file}")
@@ -238,17 +838,78 @@ def customize(resume_file, job_posting_file, output, verbose):
         click.echo("✅ Resume customization completed successfully!")
 
         # Send desktop notification if plyer is available
-        if notification:
-            try:
-                notification.notify(
-                    title="Resume Customization Complete",
-                    message=f"Resume has been successfully customized and saved as '{output}.pdf'",
-                    app_name="Resume Customizer",
-                    timeout=5
-                )
-            except Exception:
-                # Silently fail if notification fails - don't interrupt the main flow
-                pass
+        send_notification(
+            "Resume Customization Complete",
+            f"Resume has been successfully customized and saved as '{output}.pdf'",
+        )
+
+    except click.ClickException as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Unexpected error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command('customize-batch')
+@click.argument('postings', type=click.Path(exists=True))
+@click.option('--resume', '-r', 'resume_file', type=click.Path(exists=True),
+              help='Resume YAML file to use for every posting in a directory')
+@click.option('--concurrency', '-c', default=10, show_default=True, type=click.IntRange(min=1),
+              help='Maximum number of concurrent AI requests')
+@click.option('--max-rpm', type=click.FloatRange(min=0, min_open=True),
+              help='Maximum AI requests per minute (default: unlimited)')
+@click.option('--max-tpm', type=click.FloatRange(min=0, min_open=True),
+              help='Maximum prompt tokens per minute (default: unlimited)')
+@click.option('--max-attempts', default=5, show_default=True, type=click.IntRange(min=1),
+              help='Attempts per request on rate limits and transient errors')
+@click.option('--marshal-batch', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Number of job postings to combine into a single AI request (1 = off)')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+@click.option('--no-cache', is_flag=True, help='Ignore cached results and always call the AI (the new result is still cached)')
+@click.option('--keep-yaml', is_flag=True, help='Keep the modified resume YAML files for inspection')
+def customize_batch(postings, resume_file, concurrency, max_rpm, max_tpm, max_attempts, marshal_batch,
+                    verbose, no_cache, keep_yaml):
+    """Customize resumes for many job postings concurrently.
+
+    POSTINGS is either a directory of job posting .txt files (used with --resume)
+    or a CSV manifest with resume_file, job_posting_file and output columns.
+    """
+    try:
+        jobs = load_batch_jobs(postings, resume_file)
+        if not jobs:
+            raise click.ClickException(f"No job postings found in {postings}")
+
+        rate_limiter = RateLimiter(max_rpm=max_rpm, max_tpm=max_tpm) if max_rpm or max_tpm else None
+        customizer = ResumeCustomizer(  # API key is loaded from environment
+            cache=ResponseCache(),
+            use_cached=not no_cache,
+            rate_limiter=rate_limiter,
+            max_attempts=max_attempts,
+            keep_yaml=keep_yaml,
+        )
+
+        if verbose:
+            click.echo(f"Processing {len(jobs)} job postings with up to {concurrency} concurrent requests")
+            for resume, posting, output in jobs:
+                click.echo(f"  {resume} + {posting} -> {output}.pdf")
+
+        results = customizer.customize_many(jobs, max_concurrent=concurrency, marshal_batch=marshal_batch)
+
+        failures = [(job, result) for job, result in zip(jobs, results) if isinstance(result, Exception)]
+        for (_, posting, output), error in failures:
+            click.echo(f"❌ {output} ({posting}): {error}", err=True)
+
+        succeeded = len(jobs) - len(failures)
+        click.echo(f"✅ Customized {succeeded} of {len(jobs)} resumes.")
+
+        send_notification(
+            "Resume Batch Complete",
+            f"Customized {succeeded} of {len(jobs)} resumes",
+        )
+
+        if failures:
+            sys.exit(1)
 
     except click.ClickException as e:
         click.echo(f"❌ Error: {e}", err=True)